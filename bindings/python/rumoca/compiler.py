@@ -15,12 +15,26 @@ Or per-call:
     result = rumoca.compile("model.mo", prefer_system=True)
 """
 
+import functools
+import hashlib
+import io
 import json
+import os
+import re
+import shutil
 import subprocess
 import warnings
 from pathlib import Path
 from typing import Optional, Union, Dict, Any
 
+# Matches the first model/class declaration in a Modelica source file.
+# Bytes pattern so the source prefix can be scanned without decoding.
+_MODEL_RE = re.compile(rb'\b(model|class)\s+(\w+)')
+
+# Declarations sit near the top of a file; scan this much before falling
+# back to reading the whole source
+_MODEL_SCAN_BYTES = 16384
+
 # Global setting to prefer system binary over native bindings
 _prefer_system_binary: bool = False
 
@@ -48,6 +62,18 @@ def set_prefer_system_binary(value: bool) -> None:
     global _prefer_system_binary
     _prefer_system_binary = value
 
+# Optional C-accelerated JSON parser (used when installed, stdlib otherwise)
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Optional streaming JSON parser, lets __repr__ skip the full document parse
+try:
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
+
 # Try to import native bindings
 try:
     from ._native import compile_str as _native_compile_str
@@ -79,6 +105,7 @@ class CompilationResult:
         model_file: Optional[Path] = None,
         rumoca_bin: Optional[Path] = None,
         *,
+        model_name: Optional[str] = None,
         _native_result: Optional[Any] = None,
         _cached_json: Optional[str] = None,
     ):
@@ -88,14 +115,23 @@ class CompilationResult:
         Args:
             model_file: Path to the Modelica source file (for subprocess mode)
             rumoca_bin: Path to rumoca binary (for subprocess mode)
+            model_name: Model name, if already extracted by the caller
             _native_result: Native compilation result (internal use)
             _cached_json: Pre-cached JSON string (internal use)
         """
         self._native_result = _native_result
         self._model_file = Path(model_file) if model_file else None
         self._rumoca_bin = rumoca_bin
+        self._model_name = model_name
         self._cached_dict: Optional[Dict[str, Any]] = None
         self._cached_json = _cached_json
+        self._cached_json_bytes: Optional[bytes] = None
+        # Parallel name-only arrays, built once from the parsed dict so
+        # name scans don't re-traverse the per-element records
+        self._param_names: Optional[list] = None
+        self._var_names: Optional[list] = None
+        # Narrow summary used by __repr__, computed at most once
+        self._summary: Optional[Dict[str, Any]] = None
 
         # Validate for subprocess mode
         if self._native_result is None and self._model_file is not None:
@@ -114,44 +150,69 @@ class CompilationResult:
         """Returns True if using native bindings."""
         return self._native_result is not None
 
+    def _get_model_name(self) -> str:
+        """Return the model name, extracting it from the source file once."""
+        if self._model_name is None:
+            self._model_name = _extract_model_name(self._model_file)
+        return self._model_name
+
     def __repr__(self) -> str:
         """Return a detailed string representation of the compiled model."""
         try:
             if self._native_result is not None:
                 return repr(self._native_result)
 
-            # Subprocess mode - get model data
-            if self._cached_dict is None:
-                self._cached_dict = self.to_base_modelica_dict()
+            # Subprocess mode - summarize the model
+            summary = self._repr_summary()
 
-            data = self._cached_dict
-            model_name = data.get("model_name", "Unknown")
-            n_params = len(data.get("parameters", []))
-            n_vars = len(data.get("variables", []))
-            n_eqs = len(data.get("equations", []))
-
-            params = data.get("parameters", [])
-            param_names = [p["name"] for p in params[:5]]
-            if len(params) > 5:
+            param_names = summary["parameter_names"][:5]
+            if summary["n_parameters"] > 5:
                 param_names.append("...")
 
-            variables = data.get("variables", [])
-            var_names = [v["name"] for v in variables[:5]]
-            if len(variables) > 5:
+            var_names = summary["variable_names"][:5]
+            if summary["n_variables"] > 5:
                 var_names.append("...")
 
             return (
                 f"CompilationResult(\n"
-                f"  model='{model_name}',\n"
+                f"  model='{summary['model_name']}',\n"
                 f"  source={self._model_file.name if self._model_file else 'string'},\n"
-                f"  parameters={n_params}: {param_names},\n"
-                f"  variables={n_vars}: {var_names},\n"
-                f"  equations={n_eqs}\n"
+                f"  parameters={summary['n_parameters']}: {param_names},\n"
+                f"  variables={summary['n_variables']}: {var_names},\n"
+                f"  equations={summary['n_equations']}\n"
                 f")"
             )
         except Exception as e:
             return f"CompilationResult(error={e})"
 
+    def _repr_summary(self) -> Dict[str, Any]:
+        """Collect the handful of fields __repr__ needs.
+
+        When ijson is installed and the document hasn't been parsed yet,
+        the summary is produced by a streaming scan of the JSON bytes so
+        repr() on a large MSL model doesn't force a full parse of every
+        equation AST. Otherwise falls back to to_base_modelica_dict().
+        Either way the result is cached, so repeated repr() calls don't
+        re-scan the document.
+        """
+        if self._summary is not None:
+            return self._summary
+
+        if self._cached_dict is None and _ijson is not None:
+            self._summary = _scan_summary(self._to_base_modelica_json_bytes())
+            return self._summary
+
+        data = self.to_base_modelica_dict()
+        self._summary = {
+            "model_name": data.get("model_name", "Unknown"),
+            "n_parameters": len(self._param_names),
+            "n_variables": len(self._var_names),
+            "n_equations": _count_equations(data),
+            "parameter_names": self._param_names[:5],
+            "variable_names": self._var_names[:5],
+        }
+        return self._summary
+
     def to_base_modelica_json(self) -> str:
         """
         Export model to Base Modelica JSON format as a string.
@@ -169,36 +230,108 @@ class CompilationResult:
             self._cached_json = self._native_result.json
             return self._cached_json
 
-        # Subprocess mode
-        try:
-            model_name = _extract_model_name(self._model_file)
-            proc_result = subprocess.run(
-                [str(self._rumoca_bin), "--json", "-m", model_name, str(self._model_file)],
-                capture_output=True,
-                text=True,
-                check=True,
+        self._cached_json = self._to_base_modelica_json_bytes().decode("utf-8")
+        return self._cached_json
+
+    def _to_base_modelica_json_bytes(self) -> bytes:
+        """Get Base Modelica JSON as raw bytes, compiling once and caching.
+
+        Keeping the undecoded bytes around lets to_base_modelica_dict()
+        hand them to orjson directly without a UTF-8 round-trip.
+        """
+        if self._cached_json_bytes is not None:
+            return self._cached_json_bytes
+
+        model_name = self._get_model_name()
+
+        # Reuse previously compiled JSON from the on-disk cache when the
+        # source and compiler binary are unchanged
+        cache_path = None
+        if not os.environ.get("RUMOCA_NO_CACHE"):
+            cache_path = _json_cache_path(
+                self._model_file, self._rumoca_bin, model_name
             )
-            self._cached_json = proc_result.stdout
-            return self._cached_json
-        except subprocess.CalledProcessError as e:
-            error_msg = _format_compilation_error(self._model_file, e.stdout, e.stderr)
-            raise CompilationError(error_msg) from e
+        if cache_path is not None and cache_path.exists():
+            try:
+                self._cached_json_bytes = cache_path.read_bytes()
+                return self._cached_json_bytes
+            except OSError:
+                pass
+
+        # Subprocess mode: capture raw bytes, decode only on error
+        self._cached_json_bytes = _run_rumoca(
+            [str(self._rumoca_bin), "--json", "-m", model_name, str(self._model_file)],
+            self._model_file,
+        )
+
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_name(cache_path.name + f".{os.getpid()}.tmp")
+                tmp_path.write_bytes(self._cached_json_bytes)
+                tmp_path.replace(cache_path)
+            except OSError:
+                pass  # caching is best-effort
+
+        return self._cached_json_bytes
 
     def export_base_modelica_json(self, output_file: Union[str, Path]) -> None:
         """
         Export model to Base Modelica JSON file.
 
+        In subprocess mode the export shares the JSON cache with the
+        other accessors, so an earlier compile is reused and a fresh one
+        is kept for them; with RUMOCA_NO_CACHE set the compiler streams
+        directly to disk instead. Either way the destination is replaced
+        atomically and left untouched on failure.
+
         Args:
             output_file: Path where JSON file will be written
 
         Raises:
             CompilationError: If export fails
         """
-        json_str = self.to_base_modelica_json()
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            f.write(json_str)
+
+        # Native mode or already-compiled JSON: just write the cached string
+        if self._native_result is not None or self._cached_json is not None:
+            with open(output_path, "w") as f:
+                f.write(self.to_base_modelica_json())
+            return
+
+        # Subprocess mode with caching disabled: let rumoca write
+        # straight to a temp file next to the destination, capturing only
+        # stderr for error reporting. Renaming into place on success
+        # means a failed compile never touches an existing file at the
+        # destination
+        if os.environ.get("RUMOCA_NO_CACHE") and self._cached_json_bytes is None:
+            model_name = self._get_model_name()
+            tmp_path = output_path.with_name(output_path.name + f".{os.getpid()}.tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    _run_rumoca(
+                        [str(self._rumoca_bin), "--json", "-m", model_name, str(self._model_file)],
+                        self._model_file,
+                        stdout=f,
+                    )
+                tmp_path.replace(output_path)
+            except CompilationError:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            return
+
+        # Otherwise go through the shared JSON path, so the export reuses
+        # the in-memory/on-disk cache and a fresh compile populates both
+        # for later to_base_modelica_json()/to_base_modelica_dict() calls
+        payload = self._to_base_modelica_json_bytes()
+        tmp_path = output_path.with_name(output_path.name + f".{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(payload)
+            tmp_path.replace(output_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def to_base_modelica_dict(self) -> Dict[str, Any]:
         """
@@ -211,8 +344,17 @@ class CompilationResult:
             CompilationError: If export fails
         """
         if self._cached_dict is None:
-            json_str = self.to_base_modelica_json()
-            self._cached_dict = json.loads(json_str)
+            if self._cached_json is not None or self._native_result is not None:
+                payload: Union[str, bytes] = self.to_base_modelica_json()
+            else:
+                payload = self._to_base_modelica_json_bytes()
+            if _orjson is not None:
+                self._cached_dict = _orjson.loads(payload)
+            else:
+                self._cached_dict = json.loads(payload)
+            self._param_names, self._var_names = _collect_variable_names(
+                self._cached_dict
+            )
         return self._cached_dict
 
     def export(self, template: Union[str, Path]) -> str:
@@ -243,23 +385,17 @@ class CompilationResult:
         if rumoca_bin is None:
             raise RuntimeError("Rumoca binary required for template export")
 
-        model_name = _extract_model_name(self._model_file)
-        try:
-            proc_result = subprocess.run(
-                [
-                    str(rumoca_bin),
-                    "-m", model_name,
-                    "--template-file", str(template_path),
-                    str(self._model_file),
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return proc_result.stdout
-        except subprocess.CalledProcessError as e:
-            error_msg = _format_compilation_error(self._model_file, e.stdout, e.stderr)
-            raise CompilationError(error_msg) from e
+        model_name = self._get_model_name()
+        out = _run_rumoca(
+            [
+                str(rumoca_bin),
+                "-m", model_name,
+                "--template-file", str(template_path),
+                str(self._model_file),
+            ],
+            self._model_file,
+        )
+        return out.decode("utf-8")
 
 
 def compile(
@@ -287,7 +423,9 @@ def compile(
     Raises:
         FileNotFoundError: If model file doesn't exist
         RuntimeError: If rumoca binary not found (subprocess mode only)
-        CompilationError: If compilation fails
+        CompilationError: If compilation fails. In subprocess mode the
+            compiler runs lazily, so this is raised by the first export
+            call (e.g. to_base_modelica_json) rather than by compile()
 
     Example:
         >>> import rumoca
@@ -355,6 +493,7 @@ def _compile_with_native(model_path: Path) -> CompilationResult:
         native_result = _native_compile_file(str(model_path), model_name)
         return CompilationResult(
             model_file=model_path,
+            model_name=model_name,
             _native_result=native_result,
             _cached_json=native_result.json,
         )
@@ -363,19 +502,13 @@ def _compile_with_native(model_path: Path) -> CompilationResult:
 
 
 def _compile_with_subprocess(model_path: Path, rumoca_bin: Path) -> CompilationResult:
-    """Compile using subprocess call to rumoca binary."""
-    model_name = _extract_model_name(model_path)
-    try:
-        subprocess.run(
-            [str(rumoca_bin), "-m", model_name, str(model_path)],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-    except subprocess.CalledProcessError as e:
-        error_msg = _format_compilation_error(model_path, e.stdout, e.stderr)
-        raise CompilationError(error_msg) from e
+    """Compile using subprocess call to rumoca binary.
 
+    No rumoca process is spawned here: the first real invocation (e.g.
+    to_base_modelica_json) doubles as validation, so each model is only
+    compiled once. Compilation errors surface as CompilationError from
+    that first use instead of from compile() itself.
+    """
     return CompilationResult(model_path, rumoca_bin)
 
 
@@ -451,6 +584,147 @@ def compile_source(
 
 # Helper functions
 
+def _json_cache_path(
+    model_path: Path, rumoca_bin: Path, model_name: str
+) -> Optional[Path]:
+    """Content-addressed cache location for compiled Base Modelica JSON.
+
+    The key covers the model source bytes, the model name, and the
+    compiler binary's identity (path, mtime, size), so an edited source
+    or rebuilt binary misses cleanly. Lives under ~/.cache/rumoca/json
+    (honoring XDG_CACHE_HOME), alongside the MSL source cache used by the
+    Rust test harness. Set RUMOCA_NO_CACHE=1 to disable caching entirely.
+
+    Returns:
+        Cache file path, or None if the inputs could not be read
+    """
+    try:
+        key = hashlib.blake2b(digest_size=16)
+        key.update(model_path.read_bytes())
+        key.update(model_name.encode("utf-8"))
+        stat = os.stat(rumoca_bin)
+        key.update(f"{rumoca_bin}:{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8"))
+    except OSError:
+        return None
+
+    cache_root = os.environ.get("XDG_CACHE_HOME")
+    cache_dir = Path(cache_root) if cache_root else Path.home() / ".cache"
+    return cache_dir / "rumoca" / "json" / f"{key.hexdigest()}.json"
+
+
+def _run_rumoca(cmd: list, model_path: Optional[Path], stdout: Any = None) -> bytes:
+    """Run a rumoca command and return its stdout as bytes.
+
+    Drives the process with Popen/communicate directly instead of
+    subprocess.run(capture_output=True, text=True): output stays as raw
+    bytes (no per-invocation UTF-8 pass over stdout) and is only decoded
+    on the error path for message formatting.
+
+    Args:
+        cmd: Full argv for the rumoca invocation
+        model_path: Model file being compiled, for error messages
+        stdout: Optional open file object to receive stdout directly;
+            when given, the returned bytes are empty
+
+    Raises:
+        CompilationError: If the process exits non-zero
+    """
+    # close_fds=False keeps CPython on the cheap posix_spawn path for
+    # these short-lived invocations; this module opens no sensitive file
+    # descriptors, so inheriting them in the child is harmless
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE if stdout is None else stdout,
+        stderr=subprocess.PIPE,
+        close_fds=False,
+    )
+    out, err = proc.communicate()
+    if proc.returncode != 0:
+        error_msg = _format_compilation_error(
+            model_path,
+            (out or b"").decode("utf-8", errors="replace"),
+            (err or b"").decode("utf-8", errors="replace"),
+        )
+        raise CompilationError(error_msg)
+    return out if out is not None else b""
+
+
+def _collect_variable_names(data: Dict[str, Any]) -> tuple:
+    """Split variable names into (parameter_names, other_names).
+
+    Handles both the dae-0.1.0 schema, where ``variables`` is a map of
+    category lists with parameters as one category, and the flat Base
+    Modelica layout with top-level ``parameters``/``variables`` lists.
+    """
+    variables = data.get("variables")
+    if isinstance(variables, dict):
+        param_names = [v["name"] for v in variables.get("parameters", [])]
+        var_names = [
+            v["name"]
+            for category, items in variables.items()
+            if category != "parameters"
+            for v in items
+        ]
+        return param_names, var_names
+    param_names = [p["name"] for p in data.get("parameters", [])]
+    var_names = [v["name"] for v in variables or []]
+    return param_names, var_names
+
+
+def _count_equations(data: Dict[str, Any]) -> int:
+    """Count equations in either the dae-0.1.0 category map or a flat list."""
+    equations = data.get("equations", [])
+    if isinstance(equations, dict):
+        return sum(
+            len(eqs) for eqs in equations.values() if isinstance(eqs, list)
+        )
+    return len(equations)
+
+
+def _scan_summary(json_bytes: bytes) -> Dict[str, Any]:
+    """Stream-parse dae-0.1.0 JSON for the top-level summary fields.
+
+    Only the model name, element counts, and the first few parameter /
+    variable names are extracted, so cost is O(document scan) without
+    materializing any Python dicts for equations. Variables and
+    equations both nest category lists in this schema, so counts come
+    from the second-level ``<top>.<category>.item`` maps.
+    """
+    summary: Dict[str, Any] = {
+        "model_name": "Unknown",
+        "n_parameters": 0,
+        "n_variables": 0,
+        "n_equations": 0,
+        "parameter_names": [],
+        "variable_names": [],
+    }
+    for prefix, event, value in _ijson.parse(io.BytesIO(json_bytes)):
+        if event == "start_map":
+            if prefix.endswith(".item") and prefix.count(".") == 2:
+                top, category, _ = prefix.split(".")
+                if top == "variables":
+                    if category == "parameters":
+                        summary["n_parameters"] += 1
+                    else:
+                        summary["n_variables"] += 1
+                elif top == "equations":
+                    summary["n_equations"] += 1
+        elif event == "string":
+            if prefix == "model_name":
+                summary["model_name"] = value
+            elif prefix == "variables.parameters.item.name":
+                if len(summary["parameter_names"]) < 5:
+                    summary["parameter_names"].append(value)
+            elif (
+                prefix.startswith("variables.")
+                and prefix.endswith(".item.name")
+                and prefix.count(".") == 3
+            ):
+                if len(summary["variable_names"]) < 5:
+                    summary["variable_names"].append(value)
+    return summary
+
+
 def _format_compilation_error(model_path: Path, stdout: str, stderr: str) -> str:
     """Format a compilation error message from Rumoca output."""
     try:
@@ -524,14 +798,24 @@ def _extract_unimplemented_feature(stderr: str) -> str:
 
 
 def _extract_model_name(model_file: Path) -> str:
-    """Extract the model name from a Modelica file."""
-    import re
+    """Extract the model name from a Modelica file.
+
+    Reads only the first few KB of the file, where the declaration
+    almost always lives, and re-reads in full only if nothing matched
+    in the prefix.
+    """
     try:
-        with open(model_file, 'r') as f:
-            content = f.read()
-        match = re.search(r'\b(model|class)\s+(\w+)', content)
+        with open(model_file, 'rb') as f:
+            head = f.read(_MODEL_SCAN_BYTES)
+            match = _MODEL_RE.search(head)
+            if len(head) == _MODEL_SCAN_BYTES and (
+                match is None or match.end() == len(head)
+            ):
+                # no match, or a name that runs right up to the prefix
+                # boundary and may be truncated: confirm on the full file
+                match = _MODEL_RE.search(head + f.read())
         if match:
-            return match.group(2)
+            return match.group(2).decode('utf-8')
         raise CompilationError(
             f"Could not find model or class declaration in {model_file}"
         )
@@ -539,21 +823,27 @@ def _extract_model_name(model_file: Path) -> str:
         raise CompilationError(f"Could not read model file {model_file}: {e}")
 
 
+@functools.lru_cache(maxsize=1)
 def _find_rumoca_binary() -> Optional[Path]:
-    """Find the rumoca binary in PATH or common build locations."""
-    import shutil
+    """Find the rumoca binary in PATH or common build locations.
+
+    The common case is a single PATH lookup via shutil.which; the build
+    tree candidates are only constructed and stat'd when that fails. The
+    result is memoized for the life of the process; tests that change
+    PATH can call _find_rumoca_binary.cache_clear().
+    """
     rumoca_in_path = shutil.which("rumoca")
     if rumoca_in_path:
         return Path(rumoca_in_path)
 
     package_dir = Path(__file__).parent.parent.parent
-    common_locations = [
+    common_locations = (
         package_dir / "target" / "release" / "rumoca",
         package_dir / "target" / "debug" / "rumoca",
         package_dir.parent / "rumoca" / "target" / "release" / "rumoca",
-    ]
+    )
     for location in common_locations:
-        if location.exists() and location.is_file():
+        if location.is_file():
             return location
     return None
 
@@ -0,0 +1,37 @@
+"""Shared pytest fixtures for the rumoca Python interface tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import rumoca
+
+
+def get_test_model_path(model_name: str) -> Path:
+    """Get path to a test model file."""
+    # Try multiple possible locations
+    potential_paths = [
+        Path(__file__).parent.parent.parent.parent / "tests" / "fixtures" / model_name,
+        Path(__file__).parent.parent.parent / "tests" / "models" / model_name,
+        Path(__file__).parent.parent.parent.parent / "rumoca" / "tests" / "models" / model_name,
+    ]
+
+    for path in potential_paths:
+        if path.exists():
+            return path
+
+    pytest.skip(f"Test model not found: {model_name}")
+
+
+@pytest.fixture(scope="session")
+def bouncing_ball_result() -> rumoca.CompilationResult:
+    """Compile bouncing_ball.mo once and share the result across the session.
+
+    Compilation is by far the slowest part of each test; the result object
+    is read-only for every consumer, so one compile serves them all.
+    """
+    return rumoca.compile(get_test_model_path("bouncing_ball.mo"))
@@ -10,75 +10,57 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import rumoca
 from rumoca import CompilationError
+from rumoca.compiler import _find_rumoca_binary
 
+from conftest import get_test_model_path
 
-def get_test_model_path(model_name: str) -> Path:
-    """Get path to a test model file."""
-    # Try multiple possible locations
-    potential_paths = [
-        Path(__file__).parent.parent.parent / "tests" / "models" / model_name,
-        Path(__file__).parent.parent.parent.parent / "rumoca" / "tests" / "models" / model_name,
-    ]
+# Templates shipped with the repo, used by the export() tests
+TEMPLATES_DIR = Path(__file__).parent.parent.parent.parent / "examples" / "templates"
 
-    for path in potential_paths:
-        if path.exists():
-            return path
 
-    pytest.skip(f"Test model not found: {model_name}")
-
-
-def test_compile_basic():
+def test_compile_basic(bouncing_ball_result):
     """Test basic compilation of a Modelica model."""
-    model_path = get_test_model_path("bouncing_ball.mo")
-
-    result = rumoca.compile(model_path)
-    assert result is not None
-    assert isinstance(result, rumoca.CompilationResult)
+    assert bouncing_ball_result is not None
+    assert isinstance(bouncing_ball_result, rumoca.CompilationResult)
 
 
-def test_to_base_modelica_json():
+def test_to_base_modelica_json(bouncing_ball_result):
     """Test exporting to Base Modelica JSON string."""
-    model_path = get_test_model_path("bouncing_ball.mo")
-
-    result = rumoca.compile(model_path)
-    json_str = result.to_base_modelica_json()
+    json_str = bouncing_ball_result.to_base_modelica_json()
 
     assert json_str is not None
     assert isinstance(json_str, str)
     assert len(json_str) > 0
 
-    # Verify it's valid JSON
+    # Verify it's valid JSON in the DAE IR schema
     data = json.loads(json_str)
     assert "ir_version" in data
-    assert data["ir_version"] == "base-0.1.0"
+    assert data["ir_version"] == "dae-0.1.0"
     assert "model_name" in data
-    assert "parameters" in data
     assert "variables" in data
+    assert "parameters" in data["variables"]
     assert "equations" in data
 
 
-def test_to_base_modelica_dict():
+def test_to_base_modelica_dict(bouncing_ball_result):
     """Test getting Base Modelica as Python dict."""
-    model_path = get_test_model_path("bouncing_ball.mo")
-
-    result = rumoca.compile(model_path)
-    model_dict = result.to_base_modelica_dict()
+    model_dict = bouncing_ball_result.to_base_modelica_dict()
 
     assert isinstance(model_dict, dict)
-    assert model_dict["ir_version"] == "base-0.1.0"
+    assert model_dict["ir_version"] == "dae-0.1.0"
     assert "model_name" in model_dict
-    assert isinstance(model_dict["parameters"], list)
-    assert isinstance(model_dict["variables"], list)
-    assert isinstance(model_dict["equations"], list)
+    # variables and equations are maps of category lists in the DAE IR
+    assert isinstance(model_dict["variables"], dict)
+    assert isinstance(model_dict["variables"]["parameters"], list)
+    assert isinstance(model_dict["variables"]["states"], list)
+    assert isinstance(model_dict["equations"], dict)
 
 
-def test_export_base_modelica_json(tmp_path):
+def test_export_base_modelica_json(bouncing_ball_result, tmp_path):
     """Test exporting to Base Modelica JSON file."""
-    model_path = get_test_model_path("bouncing_ball.mo")
     output_path = tmp_path / "bouncing_ball.json"
 
-    result = rumoca.compile(model_path)
-    result.export_base_modelica_json(output_path)
+    bouncing_ball_result.export_base_modelica_json(output_path)
 
     assert output_path.exists()
 
@@ -86,43 +68,26 @@ def test_export_base_modelica_json(tmp_path):
     with open(output_path) as f:
         data = json.load(f)
 
-    assert data["ir_version"] == "base-0.1.0"
+    assert data["ir_version"] == "dae-0.1.0"
     assert "model_name" in data
 
 
-def test_export_casadi(tmp_path):
-    """Test exporting to CasADi Python code."""
-    model_path = get_test_model_path("bouncing_ball.mo")
-    output_path = tmp_path / "bouncing_ball_casadi.py"
-
-    result = rumoca.compile(model_path)
-    result.export_casadi(output_path)
+def test_export_casadi_template(bouncing_ball_result):
+    """Test generating CasADi Python code via the casadi template."""
+    if _find_rumoca_binary() is None:
+        pytest.skip("rumoca binary required for template export")
 
-    assert output_path.exists()
-
-    # Verify it's Python code
-    with open(output_path) as f:
-        code = f.read()
+    code = bouncing_ball_result.export(TEMPLATES_DIR / "casadi.jinja")
+    assert "import casadi" in code
 
-    assert "import casadi" in code or "import" in code
-    assert len(code) > 0
 
+def test_export_sympy_template(bouncing_ball_result):
+    """Test generating SymPy Python code via the sympy template."""
+    if _find_rumoca_binary() is None:
+        pytest.skip("rumoca binary required for template export")
 
-def test_export_sympy(tmp_path):
-    """Test exporting to SymPy Python code."""
-    model_path = get_test_model_path("bouncing_ball.mo")
-    output_path = tmp_path / "bouncing_ball_sympy.py"
-
-    result = rumoca.compile(model_path)
-    result.export_sympy(output_path)
-
-    assert output_path.exists()
-
-    # Verify it's Python code
-    with open(output_path) as f:
-        code = f.read()
-
-    assert len(code) > 0
+    code = bouncing_ball_result.export(TEMPLATES_DIR / "sympy.jinja")
+    assert "import sympy" in code
 
 
 def test_file_not_found():
@@ -131,56 +96,46 @@ def test_file_not_found():
         rumoca.compile("nonexistent_model.mo")
 
 
-def test_export_with_custom_template(tmp_path):
-    """Test using the generic export() method."""
-    model_path = get_test_model_path("bouncing_ball.mo")
-
-    result = rumoca.compile(model_path)
+def test_export_with_custom_template(bouncing_ball_result):
+    """Test using the generic export() method with a template path."""
+    if _find_rumoca_binary() is None:
+        pytest.skip("rumoca binary required for template export")
 
-    # Test with built-in template name
-    json_str = result.export("base_modelica.jinja")
-    data = json.loads(json_str)
-    assert data["ir_version"] == "base-0.1.0"
+    out = bouncing_ball_result.export(TEMPLATES_DIR / "base_modelica.jinja")
+    assert len(out) > 0
 
-    # Test with another built-in template
-    casadi_code = result.export("casadi.jinja")
-    assert len(casadi_code) > 0
 
-
-def test_bouncing_ball_structure():
+def test_bouncing_ball_structure(bouncing_ball_result):
     """Test specific structure of bouncing ball model."""
-    model_path = get_test_model_path("bouncing_ball.mo")
+    model_dict = bouncing_ball_result.to_base_modelica_dict()
 
-    result = rumoca.compile(model_path)
-    model_dict = result.to_base_modelica_dict()
+    variables = model_dict["variables"]
 
     # Check parameters
-    params = {p["name"]: p for p in model_dict["parameters"]}
+    params = {p["name"]: p for p in variables["parameters"]}
     assert "e" in params  # Coefficient of restitution
     assert params["e"]["vartype"] == "Real"
 
-    # Check variables
-    vars_dict = {v["name"]: v for v in model_dict["variables"]}
-    assert "h" in vars_dict  # Height
-    assert "v" in vars_dict  # Velocity
+    # Check states
+    states = {v["name"]: v for v in variables["states"]}
+    assert "h" in states  # Height
+    assert "v" in states  # Velocity
 
     # Check equations
     equations = model_dict["equations"]
-    assert len(equations) > 0
+    assert len(equations["continuous"]) > 0
 
 
-def test_integration_with_cyecca(tmp_path):
+def test_integration_with_cyecca(bouncing_ball_result, tmp_path):
     """Test full pipeline: Rumoca → JSON → Cyecca."""
     pytest.importorskip("cyecca", reason="Cyecca not installed")
 
     from cyecca.io import import_base_modelica
 
-    model_path = get_test_model_path("bouncing_ball.mo")
     json_path = tmp_path / "bouncing_ball.json"
 
     # Compile with Rumoca
-    result = rumoca.compile(model_path)
-    result.export_base_modelica_json(json_path)
+    bouncing_ball_result.export_base_modelica_json(json_path)
 
     # Import with Cyecca
     model = import_base_modelica(json_path)
@@ -234,15 +189,12 @@ def test_compile_source_native():
     assert data["model_name"] == "TestModel"
 
 
-def test_is_native_property():
+def test_is_native_property(bouncing_ball_result):
     """Test the is_native property on CompilationResult."""
-    model_path = get_test_model_path("bouncing_ball.mo")
-    result = rumoca.compile(model_path)
-
     # is_native should be True if native bindings are used, False otherwise
-    assert isinstance(result.is_native, bool)
+    assert isinstance(bouncing_ball_result.is_native, bool)
     if rumoca.NATIVE_AVAILABLE:
-        assert result.is_native is True
+        assert bouncing_ball_result.is_native is True
 
 
 if __name__ == "__main__":